@@ -256,7 +256,7 @@ class VectorOfEncodedVectors(LGDOCollection):
         if library == "ak":
             records_list = {
                 "encoded_data": self.encoded_data.view_as("ak", with_units=with_units),
-                "decoded_size": np.array(self.decoded_size),
+                "decoded_size": self.decoded_size.nda,
             }
             if "units" in self.attrs:
                 records_list["encoded_data"] = ak.with_parameter(
@@ -275,7 +275,7 @@ class VectorOfEncodedVectors(LGDOCollection):
             return pd.DataFrame(
                 {
                     "encoded_data": akpd.from_awkward(self.encoded_data.view_as("ak")),
-                    "decoded_size": self.decoded_size,
+                    "decoded_size": self.decoded_size.nda,
                 }
             )
 
@@ -7,8 +7,10 @@ from typing import Any
 import hist
 import numpy as np
 import pandas as pd
-from numpy.typing import NDArray
+from numba import njit
+from numpy.typing import DTypeLike, NDArray
 
+from ..utils import numba_defaults_kwargs as nb_kwargs
 from .array import Array
 from .lgdo import LGDO
 from .scalar import Scalar
@@ -202,6 +204,7 @@ class Histogram(Struct):
         attrs: dict[str, Any] | None = None,
         binedge_attrs: dict[str, Any] | None = None,
         flow: bool = True,
+        dtype: DTypeLike = np.float32,
     ) -> None:
         """A special struct to contain histogrammed data.
 
@@ -236,6 +239,10 @@ class Histogram(Struct):
                 :class:`Histogram` does not support storing counts in overflow or
                 underflow bins. This parameter just controls, whether a warning will
                 be emitted.
+        dtype
+            data type of the zero-initialized weights array allocated if
+            ``weights`` is None. Use e.g. ``numpy.uint32`` to store plain
+            counts, or ``numpy.float64`` for large weighted sums.
         """
         if isinstance(weights, hist.Hist):
             if binning is not None:
@@ -291,7 +298,7 @@ class Histogram(Struct):
             if isinstance(weights, Array):
                 w = weights
             elif weights is None:
-                w = Array(shape=[ax.nbins for ax in b], fill_val=0, dtype=np.float32)
+                w = Array(shape=[ax.nbins for ax in b], fill_val=0, dtype=dtype)
             else:
                 w = Array(weights)
 
@@ -345,42 +352,40 @@ class Histogram(Struct):
             elif not isinstance(keys, list):
                 keys = list(keys)
 
-        if (
-            isinstance(data, np.ndarray)
-            and len(data.shape) == 1
-            and len(self.binning) == 1
-        ):
+        # the binning property sorts and validates the axes on every access,
+        # resolve it only once
+        binning = self.binning
+        ndim = len(binning)
+
+        if isinstance(data, np.ndarray) and len(data.shape) == 1 and ndim == 1:
             N = len(data)
             data = [data]
         elif (
             isinstance(data, np.ndarray)
             and len(data.shape) == 2
-            and data.shape[1] == len(self.binning)
+            and data.shape[1] == ndim
         ):
             N = data.shape[0]
             data = data.T
         elif isinstance(data, pd.DataFrame) and (
-            (keys is not None and len(keys) == len(self.binning))
-            or data.ndim == len(self.binning)
+            (keys is not None and len(keys) == ndim) or data.ndim == ndim
         ):
-            if keys is not None:
-                data = data[keys]
+            # extract the columns one by one, data.values would first
+            # consolidate them into a (possibly upcast) 2D copy
+            cols = keys if keys is not None else data.columns
             N = len(data)
-            data = data.values.T
-        elif isinstance(data, Sequence) and len(data) == len(self.binning):
-            data = [d if isinstance(d, np.ndarray) else np.array(d) for d in data]
+            data = [data[k].to_numpy() for k in cols]
+        elif isinstance(data, Sequence) and len(data) == ndim:
+            data = [np.asarray(d) for d in data]
             N = len(data[0])
             if not all(len(d) == N for d in data):
                 msg = "length of all data arrays must be equal"
                 raise ValueError(msg)
         elif isinstance(data, Mapping):
-            if not isinstance(keys, Sequence) or len(keys) != len(self.binning):
+            if not isinstance(keys, Sequence) or len(keys) != ndim:
                 msg = "filling hist with Mapping data requires a list of keys with same length as histogram rank"
                 raise ValueError(msg)
-            data = [
-                data[k] if isinstance(data[k], np.ndarray) else np.array(data[k])
-                for k in keys
-            ]
+            data = [np.asarray(data[k]) for k in keys]
             N = len(data[0])
             if not all(len(d) == N for d in data):
                 msg = "length of all data arrays must be equal"
@@ -389,32 +394,63 @@ class Histogram(Struct):
             msg = "data must be 2D numpy array or list of 1D arrays with length equal to number of axes"
             raise ValueError(msg)
 
+        if w is not None and len(w) != N:
+            msg = "length of weights must match length of data"
+            raise ValueError(msg)
+
+        nda = self.weights.nda
+
+        # single range axis: bin and count in one compiled pass, no
+        # temporaries. Dtypes that numba cannot handle (e.g. float16) take
+        # the generic path below
+        if (
+            ndim == 1
+            and binning[0].is_range
+            and _is_nb_numeric(nda)
+            and _is_nb_numeric(data[0])
+            and (w is None or _is_nb_numeric(w))
+        ):
+            ax = binning[0]
+            col = np.ascontiguousarray(data[0])
+            if w is not None:
+                w = np.ascontiguousarray(w)
+            _fill_range_1d(nda, col, w, ax.first, ax.last, ax.step, ax.closedleft)
+            return
+
         idx = np.zeros(N, np.float64)  # bin indices for flattened array
         oor_mask = np.ones(N, np.bool_)  # mask to remove out of range values
-        stride = [s // self.weights.dtype.itemsize for s in self.weights.nda.strides]
-        for col, ax, s in zip(data, self.binning, stride, strict=False):
+        # strides of the C-ordered flattened array that the bin counts are built in
+        stride = [int(np.prod(nda.shape[i + 1 :])) for i in range(nda.ndim)]
+        for col, ax, s, nbins in zip(data, binning, stride, nda.shape, strict=False):
+            # axis parameters are looked up through the Struct, fetch them once
+            closedleft = ax.closedleft
             if ax.is_range:
-                idx += s * np.floor((col - ax.first) / ax.step - int(not ax.closedleft))
-                if ax.closedleft:
-                    oor_mask &= (ax.first <= col) & (col < ax.last)
+                first, last = ax.first, ax.last
+                # bin position computed in place: floor() for [a,b) bins,
+                # ceil() - 1 for (a,b] bins. The clip guards against round-off
+                # right at the range boundaries
+                b = (col - first) / ax.step
+                if closedleft:
+                    np.floor(b, out=b)
                 else:
-                    oor_mask &= (ax.first < col) & (col <= ax.last)
+                    np.ceil(b, out=b)
+                    b -= 1
+                idx += s * np.clip(b, 0, nbins - 1, out=b)
             else:
-                idx += s * (
-                    np.searchsorted(
-                        ax.edges, col, side=("right" if ax.closedleft else "left")
-                    )
-                    - 1
-                )
-                if ax.closedleft:
-                    oor_mask &= (ax.edges[0] <= col) & (col < ax.edges[-1])
-                else:
-                    oor_mask &= (ax.edges[0] < col) & (col <= ax.edges[-1])
+                edges = ax.edges
+                first, last = edges[0], edges[-1]
+                side = "right" if closedleft else "left"
+                idx += s * (np.searchsorted(edges, col, side=side) - 1)
+            if closedleft:
+                oor_mask &= (first <= col) & (col < last)
+            else:
+                oor_mask &= (first < col) & (col <= last)
 
-        # increment bin contents
-        idx = idx[oor_mask].astype(np.int64)
-        w = w[oor_mask] if w is not None else 1
-        np.add.at(self.weights.nda.reshape(-1), idx, w)
+        # count entries per bin in a single pass, then increment bin contents
+        idx = idx[oor_mask].astype(np.intp)
+        w = w[oor_mask] if w is not None else None
+        counts = np.bincount(idx, weights=w, minlength=nda.size)
+        np.add(nda, counts.reshape(nda.shape), out=nda, casting="unsafe")
 
     def __setitem__(self, name: str, obj: LGDO) -> None:
         # do not allow for new attributes on this
@@ -523,3 +559,35 @@ class Histogram(Struct):
 
         msg = f"{library!r} is not a supported third-party format."
         raise TypeError(msg)
+
+
+def _is_nb_numeric(a: NDArray) -> bool:
+    """whether :func:`_fill_range_1d` can be compiled for the dtype of `a`"""
+    dtype = np.asarray(a).dtype
+    return dtype.kind in "iu" or dtype in (np.float32, np.float64)
+
+
+@njit(**nb_kwargs)
+def _fill_range_1d(nda, col, w, first, last, step, closedleft):
+    """numbified inner loop of :meth:`Histogram.fill` for one range axis"""
+    nbins = len(nda)
+    # accumulate in double precision like np.bincount, then add to the weights
+    counts = np.zeros(nbins, np.float64)
+    for i in range(len(col)):
+        x = col[i]
+        if closedleft:
+            if not (first <= x < last):
+                continue
+            b = int(np.floor((x - first) / step))
+        else:
+            if not (first < x <= last):
+                continue
+            b = int(np.ceil((x - first) / step)) - 1
+        # guard against round-off right at the range boundaries
+        b = min(max(b, 0), nbins - 1)
+        if w is None:
+            counts[b] += 1
+        else:
+            counts[b] += w[i]
+    for b in range(nbins):
+        nda[b] += counts[b]
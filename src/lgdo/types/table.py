@@ -7,7 +7,8 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Collection, Mapping
-from types import ModuleType
+from functools import lru_cache
+from types import CodeType, ModuleType
 from typing import Any
 from warnings import warn
 
@@ -464,30 +465,31 @@ class Table(Struct, LGDOCollection):
             parameters = {}
 
         # get the valid python variable names in the expression
-        c = compile(expr, "0vbb is real!", "eval")
+        c = _compile_expr(expr)
 
         # make a dictionary of low-level objects (numpy or awkward)
-        # for later computation
-        flat_self = self.flatten()
+        # for later computation. Only the columns referenced in the
+        # expression are looked up, the table is not flattened
         self_unwrap = {}
         has_only_np = False
         for obj in c.co_names:
-            if obj in flat_self:
+            col = _get_flat_column(self, obj)
+            if col is not None:
                 # use the user-selected library or use the np/ak default depending on the type.
                 col_library = library or "np"
-                if library is None and isinstance(flat_self[obj], VectorOfVectors):
+                if library is None and isinstance(col, VectorOfVectors):
                     col_library = "ak"
                 has_only_np = has_only_np or col_library == "np"
 
                 if col_library == "lgdo":
-                    self_unwrap[obj] = flat_self[obj]
+                    self_unwrap[obj] = col
                 else:
-                    self_unwrap[obj] = flat_self[obj].view_as(
-                        col_library, with_units=with_units
-                    )
+                    self_unwrap[obj] = col.view_as(col_library, with_units=with_units)
 
-        msg = f"evaluating {expr!r} with locals={(self_unwrap | parameters)} and {has_only_np=}"
-        log.debug(msg)
+        # the message holds the repr of every column, only format it if needed
+        if log.isEnabledFor(logging.DEBUG):
+            msg = f"evaluating {expr!r} with locals={(self_unwrap | parameters)} and {has_only_np=}"
+            log.debug(msg)
 
         def _make_lgdo(data):
             if data.ndim == 0:
@@ -511,8 +513,9 @@ class Table(Struct, LGDOCollection):
                     local_dict=(self_unwrap | parameters),
                 )
 
-                msg = f"...the result is {out_data!r}"
-                log.debug(msg)
+                if log.isEnabledFor(logging.DEBUG):
+                    msg = f"...the result is {out_data!r}"
+                    log.debug(msg)
 
                 # need to convert back to LGDO
                 # np.evaluate should always return a numpy thing?
@@ -530,10 +533,11 @@ class Table(Struct, LGDOCollection):
         if modules is not None:
             globs = globs | modules
 
-        out_data = eval(expr, globs, (self_unwrap | parameters))
+        out_data = eval(c, globs, (self_unwrap | parameters))
 
-        msg = f"...the result is {out_data!r}"
-        log.debug(msg)
+        if log.isEnabledFor(logging.DEBUG):
+            msg = f"...the result is {out_data!r}"
+            log.debug(msg)
 
         # need to convert back to LGDO
         if isinstance(out_data, ak.Array):
@@ -668,6 +672,41 @@ class Table(Struct, LGDOCollection):
         raise TypeError(msg)
 
 
+@lru_cache(maxsize=256)
+def _compile_expr(expr: str) -> CodeType:
+    """Compile a :meth:`Table.eval` expression, cached by expression string.
+
+    Tables are typically evaluated chunk by chunk with the same expressions,
+    there is no need to parse them again every time.
+    """
+    return compile(expr, "0vbb is real!", "eval")
+
+
+def _get_flat_column(table: Table, name: str) -> LGDO | None:
+    """Return the column that :meth:`Table.flatten` would store under `name`.
+
+    Nested columns are scoped with two underscores (e.g. ``tbl2__b``). Returns
+    ``None`` if no such column exists.
+    """
+    obj = table.obj_dict.get(name)
+    if obj is not None and not isinstance(obj, Table):
+        return obj
+
+    # try all the possible splits of name into <subtable>__<column>
+    head, sep, tail = name.partition("__")
+    while sep:
+        sub = table.obj_dict.get(head)
+        if isinstance(sub, Table):
+            obj = _get_flat_column(sub, tail)
+            if obj is not None:
+                return obj
+
+        nxt, sep, tail = tail.partition("__")
+        head = f"{head}__{nxt}"
+
+    return None
+
+
 def _ak_to_lgdo_or_col_dict(array: ak.Array):
     if isinstance(array.type.content, ak.types.RecordType):
         return {field: _ak_to_lgdo_or_col_dict(array[field]) for field in array.fields}
@@ -14,9 +14,10 @@ import awkward_pandas as akpd
 import numpy as np
 import pandas as pd
 import pyarrow as pa
-from numba import jit
+from numba import njit
 from numpy.typing import ArrayLike, DTypeLike, NDArray
 
+from ..utils import numba_defaults_kwargs as nb_kwargs
 from . import arrayofequalsizedarrays as aoesa
 from .array import Array
 from .lgdo import LGDOCollection
@@ -356,7 +357,9 @@ class VectorOfVectors(LGDOCollection):
 
     def __len__(self) -> int:
         """Return the number of stored vectors along the first axis (0)."""
-        return len(self.cumulative_length)
+        # NOTE: do not go through the cumulative_length property, which
+        # allocates a new view each time
+        return max(len(self._offsets) - 1, 0)
 
     def __eq__(self, other: VectorOfVectors) -> bool:
         if isinstance(other, VectorOfVectors):
@@ -385,14 +388,32 @@ class VectorOfVectors(LGDOCollection):
 
         if isinstance(i, int):
             if self.ndim == 2:
-                stop = self.cumulative_length[i]
-                if i in (0, -len(self)):
-                    return self.flattened_data[0:stop]
+                size = len(self)
+                if i < -size or i >= size:
+                    msg = f"index {i} is out of bounds for vector with size {size}"
+                    raise IndexError(msg)
+                if i < 0:
+                    i += size
 
-                return self.flattened_data[self.cumulative_length[i - 1] : stop]
+                offsets = self._offsets.nda
+                return self.flattened_data.nda[offsets[i] : offsets[i + 1]]
 
             raise NotImplementedError
 
+        # contiguous slices map to a single block of flattened_data, no need
+        # to go through awkward
+        if isinstance(i, slice) and i.step in (None, 1) and self.ndim == 2:
+            start, stop, _ = i.indices(len(self))
+            stop = max(start, stop)
+            offsets = self._offsets.nda
+            return VectorOfVectors(
+                flattened_data=self.flattened_data.nda[
+                    offsets[start] : offsets[stop]
+                ].copy(),
+                offsets=offsets[start : stop + 1] - offsets[start],
+                attrs=self.attrs,
+            )
+
         return VectorOfVectors(
             self.view_as("ak")[i], dtype=self.dtype, attrs=self.attrs
         )
@@ -671,11 +692,10 @@ class VectorOfVectors(LGDOCollection):
 
     def __iter__(self) -> Iterator[NDArray]:
         if self.ndim == 2:
-            for j, stop in enumerate(self.cumulative_length):
-                if j == 0:
-                    yield self.flattened_data[0:stop]
-                else:
-                    yield self.flattened_data[self.cumulative_length[j - 1] : stop]
+            offsets = self._offsets.nda
+            fd = self.flattened_data.nda
+            for j in range(len(offsets) - 1):
+                yield fd[offsets[j] : offsets[j + 1]]
         else:
             raise NotImplementedError
 
@@ -810,19 +830,20 @@ class VectorOfVectors(LGDOCollection):
                 ).layout
             # need to handle strings separately
             elif np.issubdtype(self.flattened_data.nda.dtype, np.bytes_):
-                byte_arrays = []
-                if len(self.flattened_data.nda) == 0:
-                    # if the flattened data is empty, we need to create an empty
-                    # array of bytes
-                    byte_arrays.append(np.array([], dtype=np.uint8))
-                for s in self.flattened_data.nda:
-                    # Convert each string to array of bytes
-                    byte_array = np.frombuffer(s, dtype=np.uint8)
-                    byte_arrays.append(byte_array)
-                max_len = max(len(b) for b in byte_arrays)
-                raw_arrays = ak.contents.NumpyArray(np.concatenate(byte_arrays))
+                # view the fixed-width strings as a 2D array of bytes, then
+                # drop the trailing columns that only hold null padding
+                nda = np.ascontiguousarray(self.flattened_data.nda)
+                raw = nda.view(np.uint8).reshape(len(nda), nda.dtype.itemsize)
+                used = np.flatnonzero(raw.any(axis=0))
+                max_len = int(used[-1]) + 1 if len(used) > 0 else 0
+                raw_arrays = ak.contents.NumpyArray(
+                    np.ascontiguousarray(raw[:, :max_len]).reshape(-1)
+                )
                 array_of_chars = ak.contents.RegularArray(
-                    raw_arrays, max_len, parameters={"__array__": "bytes"}
+                    raw_arrays,
+                    max_len,
+                    zeros_length=len(nda),
+                    parameters={"__array__": "bytes"},
                 )
                 content = ak.enforce_type(array_of_chars, "bytes", highlevel=False)
             else:
@@ -867,8 +888,9 @@ class VectorOfVectors(LGDOCollection):
         raise ValueError(msg)
 
 
-@jit
+@njit(**nb_kwargs)
 def _to_aoesa(flattened_array, cumulative_length, nda):
+    """numbified inner loop for :meth:`VectorOfVectors.to_aoesa`"""
     prev_cl = 0
     for i, cl in enumerate(cumulative_length):
         nda[i, : (cl - prev_cl)] = flattened_array[prev_cl:cl]
@@ -155,14 +155,14 @@ class WaveformTable(Table):
                     values = VectorOfVectors(shape_guess=shape_guess, dtype=dtype)
                 else:
                     flattened_data = np.concatenate(values)
-                    length = 0
-                    cumulative_length = []
-                    for i in range(size):
-                        length += len(values[i])
-                        cumulative_length.append(length)
+                    lengths = np.fromiter(
+                        (len(values[i]) for i in range(size)),
+                        dtype=np.int64,
+                        count=size,
+                    )
                     values = VectorOfVectors(
                         flattened_data=flattened_data,
-                        cumulative_length=cumulative_length,
+                        cumulative_length=np.cumsum(lengths),
                         dtype=dtype,
                     )
             else:  # make a ArrayOfEqualSizedArrays
@@ -285,6 +285,17 @@ def test_histogram_fill():
     assert all(h.weights.nda == np.array([2.0, 2.0, 0.0, 2.0, 1.0]))
     h.fill(np.array([-1.0, 6.0, np.inf, np.nan]))  # add out of range data
     assert all(h.weights.nda == np.array([2.0, 2.0, 0.0, 2.0, 1.0]))
+    h.fill(np.array([0.5, 2.5, 7.0]), w=np.array([0.5, 3.0, 1.0]))  # weighted
+    assert all(h.weights.nda == np.array([2.5, 2.0, 3.0, 2.0, 1.0]))
+
+    # Test integer bin counts
+    h = Histogram(None, [(0, 5, 1)], dtype=np.uint32)
+    assert h.weights.nda.dtype == np.uint32
+    h.fill(np.array([0.5, 1.5, 1.1, 7.0]))
+    assert all(h.weights.nda == np.array([1, 2, 0, 0, 0]))
+    h = Histogram(None, [(0, 3, 1), (0, 3, 1)], dtype=np.uint32)
+    h.fill(np.array([[1, 1], [2, 2], [2, 2], [-1, 2]]))
+    assert np.all(h.weights.nda == np.array([[0, 0, 0], [0, 1, 0], [0, 0, 2]]))
 
     # Test the basics with variable width bins
     h = Histogram(None, [np.array([0.0, 0.75, 2.0, 4.0, 4.5, 5.0])])
@@ -302,6 +313,8 @@ def test_histogram_fill():
     h = Histogram(None, [Histogram.Axis(None, 0, 6, 1, closedleft=False)])
     h.fill(np.array([0, 2, 4, 6]))
     assert all(h.weights.nda == np.array([0.0, 1.0, 0.0, 1.0, 0.0, 1.0]))
+    h.fill(np.array([0.5, 2.5, 5.5]))
+    assert all(h.weights.nda == np.array([1.0, 1.0, 1.0, 1.0, 0.0, 2.0]))
 
     # Test bin edge behavior with variable width bins
     h = Histogram(
@@ -325,6 +338,34 @@ def test_histogram_fill():
     h.fill(np.array([0, 2, 4, 6]))
     assert all(h.weights.nda == np.array([0.0, 1.0, 1.0, 0.0, 0.0, 1.0]))
 
+    # Test fixed width bins agree with the equivalent variable width bins
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=1000)
+    w = rng.uniform(size=1000)
+    for closedleft in (True, False):
+        h = Histogram(None, [Histogram.Axis(None, -2, 2, 0.1, closedleft)])
+        h.fill(data, w=w)
+        edges = np.linspace(-2, 2, 41)
+        h_var = Histogram(None, [Histogram.Axis(edges, None, None, None, closedleft)])
+        h_var.fill(data, w=w)
+        assert np.array_equal(h.weights.nda, h_var.weights.nda)
+
+    # Test dtypes not supported by numba
+    h = Histogram(None, [(0, 5, 1)])
+    h.fill(np.array([0.5, 1.5, 1.1], dtype=np.float16))
+    h.fill(np.array([3.5]), w=np.array([2.0], dtype=np.float16))
+    assert all(h.weights.nda == np.array([1.0, 2.0, 0.0, 2.0, 0.0]))
+    h = Histogram(np.zeros(5, dtype=np.float16), [(0, 5, 1)])
+    h.fill(np.array([0.5, 1.5, 1.1]))
+    assert all(h.weights.nda == np.array([1.0, 2.0, 0.0, 0.0, 0.0]))
+
+    # Test weights with mismatched length
+    for binning in ([(0, 5, 1)], [np.array([0.0, 1.0, 2.0, 5.0])]):
+        h = Histogram(None, binning)
+        for w in (np.array([1.0]), np.ones(5)):
+            with pytest.raises(ValueError, match="length of weights"):
+                h.fill(np.array([0.5, 1.5, 2.5, 3.5]), w=w)
+
     # Test 2d histogram with numpy array data
     h = Histogram(None, [(0, 3, 1), (0, 3, 1)])
     data = np.array([[1, 1], [2, 2], [-1, 2], [2, -1]])
@@ -333,6 +374,12 @@ def test_histogram_fill():
         h.weights.nda == np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
     )
 
+    # Test 2d histogram wrapping the (non C-contiguous) view of a hist.Hist
+    hh = hist.Hist(hist.axis.Regular(3, 0, 3), hist.axis.Regular(2, 0, 2))
+    h = Histogram(hh)
+    h.fill(np.array([[0.5, 1.5], [2.5, 0.5], [2.5, 0.5], [5.0, 0.0]]))
+    assert np.all(hh.view() == np.array([[0.0, 1.0], [0.0, 0.0], [2.0, 0.0]]))
+
     # Test 2d histogram with pandas data
     h = Histogram(None, [(0, 3, 1), (0, 3, 1)])
     data = pd.DataFrame({"a": [1, 2, -1, 2], "b": [1, 2, 2, -1]})
@@ -46,6 +46,11 @@ def test_eval_dependency():
     assert isinstance(r, lgdo.Array)
     assert np.array_equal(r.nda, obj.a.nda + obj.tbl.z.nda)
 
+    obj.tbl.add_field("sub", lgdo.Table(col_dict={"w": lgdo.Array([2, 2, 2, 2])}))
+    r = obj.eval("tbl__z + tbl__sub__w")
+    assert np.array_equal(r.nda, [3, 3, 3, 3])
+    obj.tbl.remove_field("sub", delete=True)
+
     r = obj.eval("((a - b) > 1) & ((b - a) < -1)")
     assert isinstance(r, lgdo.Array)
     assert r.dtype == "bool"
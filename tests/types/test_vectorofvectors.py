@@ -229,6 +229,13 @@ def test_getitem(testvov):
     new_desired = VectorOfVectors([desired[1], desired[3]], dtype=testvov.dtype)
     test_slice = testvov[1::2]
     assert test_slice == new_desired
+
+    test_slice = testvov[1:4]
+    assert test_slice == VectorOfVectors(desired[1:4], dtype=testvov.dtype)
+    test_slice.resize(1)
+    assert np.array_equal(testvov[2], desired[2])
+    assert len(testvov[3:1]) == 0
+    assert testvov[-2:] == VectorOfVectors(desired[-2:], dtype=testvov.dtype)
     test_fancy = testvov[[1, 3]]
     assert test_fancy == new_desired
     test_mask = testvov[np.array([0, 1, 0, 1, 0], dtype="bool")]
@@ -623,6 +630,33 @@ def test_bytestrings():
     assert v.flattened_data.dtype == "S7"
     assert v.flattened_data.nda[0] == b"V00000A"
 
+    # test mixed-length bytestrings keep their null padding in the view
+    vs = VectorOfVectors(
+        flattened_data=np.array([b"a", b"bcd", b"ef"], dtype="S4"),
+        cumulative_length=np.array([1, 3], dtype="uint32"),
+    )
+    ak_strs = vs.view_as("ak", with_units=False)
+    assert ak_strs.tolist() == [[b"a\x00\x00"], [b"bcd", b"ef\x00"]]
+    vs = VectorOfVectors(ak_strs)
+    assert np.array_equal(vs.flattened_data.nda, np.array([b"a", b"bcd", b"ef"]))
+    assert np.array_equal(vs.cumulative_length.nda, [1, 3])
+
+    # test bytestrings in a non-contiguous buffer
+    vs = VectorOfVectors(
+        flattened_data=Array(nda=np.array([b"ab", b"cd", b"ef", b"gh"], "S2")[::2]),
+        cumulative_length=np.array([1, 2], dtype="uint32"),
+    )
+    assert vs.view_as("ak", with_units=False).tolist() == [[b"ab"], [b"ef"]]
+
+    # test all-empty bytestrings
+    vs = VectorOfVectors(
+        flattened_data=np.array([b"", b""], dtype="S3"),
+        cumulative_length=np.array([1, 2], dtype="uint32"),
+    )
+    ak_strs = vs.view_as("ak", with_units=False)
+    assert ak.is_valid(ak_strs)
+    assert ak_strs.tolist() == [[b""], [b""]]
+
     # test nested bytestring VoVoV
 
     v = VectorOfVectors(